@@ -229,12 +229,12 @@ def prepare_messages(messages: str | ChatMessage | list[str] | list[ChatMessage]
         return [ChatMessage(role="user", text=messages)]
     if isinstance(messages, ChatMessage):
         return [messages]
-    return_messages: list[ChatMessage] = []
-    for msg in messages:
-        if isinstance(msg, str):
-            msg = ChatMessage(role="user", text=msg)
-        return_messages.append(msg)
-    return return_messages
+    # Common case: already a list of ChatMessage objects. Copy it in one pass
+    # instead of rebuilding element by element; a fresh list is still returned
+    # because callers append to the result during tool-call loops.
+    if all(isinstance(msg, ChatMessage) for msg in messages):
+        return list(messages)  # type: ignore[arg-type]
+    return [ChatMessage(role="user", text=msg) if isinstance(msg, str) else msg for msg in messages]
 
 
 def merge_chat_options(
@@ -292,10 +292,7 @@ def merge_chat_options(
     if base_chat_options is not None and not isinstance(base_chat_options, ChatOptions):
         raise TypeError("chat_options must be an instance of ChatOptions")
 
-    if base_chat_options is None:
-        base_chat_options = ChatOptions()
-
-    return base_chat_options & ChatOptions(
+    overrides = ChatOptions(
         model_id=model_id,
         frequency_penalty=frequency_penalty,
         logit_bias=logit_bias,
@@ -314,6 +311,13 @@ def merge_chat_options(
         additional_properties=additional_properties,
     )
 
+    if base_chat_options is None:
+        # Nothing to merge into - skip the serialize/deserialize round-trip
+        # that ChatOptions.__and__ performs against an empty base.
+        return overrides
+
+    return base_chat_options & overrides
+
 
 class BaseChatClient(SerializationMixin, ABC):
     """Base class for chat clients.
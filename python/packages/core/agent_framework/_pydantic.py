@@ -31,6 +31,7 @@ class AFBaseSettings(BaseSettings):
     """
 
     env_prefix: ClassVar[str] = ""
+    _applied_settings_config: ClassVar[tuple[str, str, str] | None] = None
     env_file_path: str | None = Field(default=None, exclude=True)
     env_file_encoding: str | None = Field(default="utf-8", exclude=True)
 
@@ -59,10 +60,16 @@ class AFBaseSettings(BaseSettings):
             env_file_path = kwargs["env_file_path"]
         else:
             env_file_path = ".env"
-        cls.model_config.update(  # type: ignore
-            env_prefix=cls.env_prefix,
-            env_file=env_file_path,
-            env_file_encoding=env_file_encoding,
-        )
-        cls.model_rebuild()
+        # Updating model_config and rebuilding is only needed when the
+        # effective config for this class actually changes; repeated
+        # instantiations with the same (or default) sources skip it.
+        config_key = (cls.env_prefix, env_file_path, env_file_encoding)
+        if cls.__dict__.get("_applied_settings_config") != config_key:
+            cls.model_config.update(  # type: ignore
+                env_prefix=cls.env_prefix,
+                env_file=env_file_path,
+                env_file_encoding=env_file_encoding,
+            )
+            cls.model_rebuild()
+            cls._applied_settings_config = config_key
         return super().__new__(cls)  # type: ignore[return-value]
@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import asyncio
+import copy
 import json
 import logging
 import os
@@ -13,9 +14,46 @@ from typing import Any, Protocol
 
 from ._const import DEFAULT_MAX_ITERATIONS
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json works everywhere
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps_checkpoint(data: dict[str, Any]) -> bytes:
+    """Serialize a checkpoint dict to indented JSON bytes.
+
+    Uses orjson when installed (several times faster and writes UTF-8 bytes
+    directly), falling back to the stdlib encoder otherwise or when orjson
+    rejects a value it cannot represent (e.g. integers beyond 64 bits). Note
+    that orjson writes non-finite floats (NaN/Infinity) as null, where the
+    stdlib encoder emits non-standard NaN/Infinity literals.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)  # type: ignore[no-any-return]
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads_checkpoint(payload: bytes) -> dict[str, Any]:
+    """Parse checkpoint JSON bytes with orjson when available.
+
+    Falls back to the stdlib parser when orjson rejects the payload, so
+    checkpoints written by the stdlib encoder (which emits non-standard
+    NaN/Infinity literals for non-finite floats) stay loadable.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)  # type: ignore[no-any-return]
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(payload)  # type: ignore[no-any-return]
+
+
 @dataclass(slots=True)
 class WorkflowCheckpoint:
     """Represents a complete checkpoint of workflow state."""
@@ -117,18 +155,61 @@ class FileCheckpointStorage:
         """Initialize the file storage."""
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        # Parsed-file cache keyed by path; entries are validated against the
+        # file's (st_mtime_ns, st_size) so stale parses are never served.
+        self._parse_cache: dict[str, tuple[int, int, dict[str, Any]]] = {}
         logger.info(f"Initialized file checkpoint storage at {self.storage_path}")
 
+    def _checkpoint_files(self) -> list[Path]:
+        """Enumerate checkpoint JSON files with a single directory scan.
+
+        os.scandir reports entry types from the directory listing itself,
+        avoiding a stat call per file on most platforms.
+        """
+        try:
+            with os.scandir(self.storage_path) as entries:
+                return [Path(entry.path) for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+        except FileNotFoundError:
+            return []
+
+    def _read_checkpoint_file(self, file_path: Path) -> dict[str, Any]:
+        """Read and parse a checkpoint file, reusing the cached parse when unchanged.
+
+        Listing and loading repeatedly re-parse the same JSON files even though
+        checkpoint files are immutable once written. Returns a deep copy so
+        callers can freely mutate the result without corrupting the cache.
+        """
+        stat_result = file_path.stat()
+        key = str(file_path)
+        cached = self._parse_cache.get(key)
+        if cached is not None and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+            return copy.deepcopy(cached[2])
+        data = _loads_checkpoint(file_path.read_bytes())
+        self._parse_cache[key] = (stat_result.st_mtime_ns, stat_result.st_size, data)
+        return copy.deepcopy(data)
+
     async def save_checkpoint(self, checkpoint: WorkflowCheckpoint) -> str:
         """Save a checkpoint and return its ID."""
         file_path = self.storage_path / f"{checkpoint.checkpoint_id}.json"
         checkpoint_dict = asdict(checkpoint)
 
         def _write_atomic() -> None:
+            payload = _dumps_checkpoint(checkpoint_dict)
             tmp_path = file_path.with_suffix(".json.tmp")
-            with open(tmp_path, "w") as f:
-                json.dump(checkpoint_dict, f, indent=2, ensure_ascii=False)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
             os.replace(tmp_path, file_path)
+            # Prime the parse cache so a load or list right after a save
+            # skips the disk read. The cached entry is parsed from the bytes
+            # just written (not the in-memory dict) because the encoder may
+            # rewrite values, e.g. orjson turns NaN into null; a warm read
+            # must match what a cold read of the file would return.
+            stat_result = file_path.stat()
+            self._parse_cache[str(file_path)] = (
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+                _loads_checkpoint(payload),
+            )
 
         await asyncio.to_thread(_write_atomic)
 
@@ -142,11 +223,7 @@ class FileCheckpointStorage:
         if not file_path.exists():
             return None
 
-        def _read() -> dict[str, Any]:
-            with open(file_path) as f:
-                return json.load(f)  # type: ignore[no-any-return]
-
-        checkpoint_dict = await asyncio.to_thread(_read)
+        checkpoint_dict = await asyncio.to_thread(self._read_checkpoint_file, file_path)
 
         checkpoint = WorkflowCheckpoint(**checkpoint_dict)
         logger.info(f"Loaded checkpoint {checkpoint_id} from {file_path}")
@@ -156,15 +233,19 @@ class FileCheckpointStorage:
         """List checkpoint IDs. If workflow_id is provided, filter by that workflow."""
 
         def _list_ids() -> list[str]:
+            # Every file is parsed (via the stat-validated cache, so warm
+            # calls stay cheap) even when no filter is given: unreadable or
+            # foreign .json files must be skipped, not listed as ids that
+            # load_checkpoint would then fail on.
             checkpoint_ids: list[str] = []
-            for file_path in self.storage_path.glob("*.json"):
+            for file_path in self._checkpoint_files():
                 try:
-                    with open(file_path) as f:
-                        data = json.load(f)
-                    if workflow_id is None or data.get("workflow_id") == workflow_id:
-                        checkpoint_ids.append(data.get("checkpoint_id", file_path.stem))
+                    data = self._read_checkpoint_file(file_path)
                 except Exception as e:
                     logger.warning(f"Failed to read checkpoint file {file_path}: {e}")
+                    continue
+                if workflow_id is None or data.get("workflow_id") == workflow_id:
+                    checkpoint_ids.append(data.get("checkpoint_id", file_path.stem))
             return checkpoint_ids
 
         return await asyncio.to_thread(_list_ids)
@@ -172,19 +253,20 @@ class FileCheckpointStorage:
     async def list_checkpoints(self, workflow_id: str | None = None) -> list[WorkflowCheckpoint]:
         """List checkpoint objects. If workflow_id is provided, filter by that workflow."""
 
-        def _list_checkpoints() -> list[WorkflowCheckpoint]:
-            checkpoints: list[WorkflowCheckpoint] = []
-            for file_path in self.storage_path.glob("*.json"):
-                try:
-                    with open(file_path) as f:
-                        data = json.load(f)
-                    if workflow_id is None or data.get("workflow_id") == workflow_id:
-                        checkpoints.append(WorkflowCheckpoint.from_dict(data))
-                except Exception as e:
-                    logger.warning(f"Failed to read checkpoint file {file_path}: {e}")
-            return checkpoints
+        def _load_one(file_path: Path) -> WorkflowCheckpoint | None:
+            try:
+                data = self._read_checkpoint_file(file_path)
+                if workflow_id is None or data.get("workflow_id") == workflow_id:
+                    return WorkflowCheckpoint.from_dict(data)
+            except Exception as e:
+                logger.warning(f"Failed to read checkpoint file {file_path}: {e}")
+            return None
 
-        return await asyncio.to_thread(_list_checkpoints)
+        # Per-file loads are dominated by I/O latency, so fan them out across
+        # worker threads instead of reading sequentially in a single thread.
+        file_paths = await asyncio.to_thread(self._checkpoint_files)
+        results = await asyncio.gather(*(asyncio.to_thread(_load_one, file_path) for file_path in file_paths))
+        return [checkpoint for checkpoint in results if checkpoint is not None]
 
     async def delete_checkpoint(self, checkpoint_id: str) -> bool:
         """Delete a checkpoint by ID."""
@@ -193,6 +275,7 @@ class FileCheckpointStorage:
         def _delete() -> bool:
             if file_path.exists():
                 file_path.unlink()
+                self._parse_cache.pop(str(file_path), None)
                 logger.info(f"Deleted checkpoint {checkpoint_id} from {file_path}")
                 return True
             return False
@@ -542,10 +542,34 @@ class RequestInfoExecutor(Executor):
 # region: Utility Functions
 
 
+def _is_json_safe(value: Any) -> bool:
+    """Check whether a value is already JSON-safe, without recursion or copies."""
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if current is None or type(current) in (str, int, float, bool):
+            continue
+        if type(current) is dict:
+            for key, val in current.items():
+                if type(key) is not str:
+                    return False
+                stack.append(val)
+        elif type(current) is list:
+            stack.extend(current)
+        else:
+            return False
+    return True
+
+
 def _make_json_safe(value: Any) -> Any:
     """Recursively convert a value to a JSON-safe representation."""
     if value is None or isinstance(value, (str, int, float, bool)):
         return value
+    # Callers pass freshly built structures (asdict/model_dump output) that are
+    # usually plain str-keyed dicts and lists already; skip the rebuild entirely
+    # in that common case instead of allocating a parallel copy of every node.
+    if _is_json_safe(value):
+        return value
     if isinstance(value, Mapping):
         safe_dict: dict[str, Any] = {}
         for key, val in value.items():  # type: ignore[attr-defined]
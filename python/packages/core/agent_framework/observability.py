@@ -5,7 +5,7 @@ import json
 import logging
 from collections.abc import AsyncIterable, Awaitable, Callable, Generator, Mapping
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 from time import perf_counter, time_ns
 from typing import TYPE_CHECKING, Any, ClassVar, Final, TypeVar
 
@@ -779,7 +779,10 @@ def setup_observability(
 # region Chat Client Telemetry
 
 
+@lru_cache(maxsize=1)
 def _get_duration_histogram() -> "metrics.Histogram":
+    # Instruments are process-wide in OpenTelemetry; creating them once and
+    # sharing across clients avoids re-registering per client instance.
     return get_meter().create_histogram(
         name=Meters.LLM_OPERATION_DURATION,
         unit=OtelAttr.DURATION_UNIT,
@@ -788,6 +791,7 @@ def _get_duration_histogram() -> "metrics.Histogram":
     )
 
 
+@lru_cache(maxsize=1)
 def _get_token_usage_histogram() -> "metrics.Histogram":
     return get_meter().create_histogram(
         name=Meters.LLM_TOKEN_USAGE,
@@ -281,6 +281,41 @@ async def test_file_checkpoint_storage_corrupted_file():
         assert checkpoints == []
 
 
+async def test_file_checkpoint_storage_parse_cache():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage = FileCheckpointStorage(temp_dir)
+        checkpoint = WorkflowCheckpoint(workflow_id="cached-workflow", shared_state={"key": "value"})
+        await storage.save_checkpoint(checkpoint)
+
+        # Saving primes the cache, so a load after save needs no re-parse
+        file_key = str(Path(temp_dir) / f"{checkpoint.checkpoint_id}.json")
+        assert file_key in storage._parse_cache
+
+        # First load populates the cache; a second load is served from it
+        first = await storage.load_checkpoint(checkpoint.checkpoint_id)
+        second = await storage.load_checkpoint(checkpoint.checkpoint_id)
+        assert first is not None
+        assert second is not None
+
+        # Cached loads must not share mutable state between callers
+        first.shared_state["key"] = "mutated"
+        assert second.shared_state["key"] == "value"
+
+        # Rewriting the file with different content invalidates the cache entry
+        file_path = Path(temp_dir) / f"{checkpoint.checkpoint_id}.json"
+        data = json.loads(file_path.read_text())
+        data["shared_state"] = {"key": "rewritten"}
+        file_path.write_text(json.dumps(data))
+
+        reloaded = await storage.load_checkpoint(checkpoint.checkpoint_id)
+        assert reloaded is not None
+        assert reloaded.shared_state == {"key": "rewritten"}
+
+        # Deleting the checkpoint drops its cache entry along with the file
+        assert await storage.delete_checkpoint(checkpoint.checkpoint_id) is True
+        assert await storage.load_checkpoint(checkpoint.checkpoint_id) is None
+
+
 async def test_file_checkpoint_storage_json_serialization():
     with tempfile.TemporaryDirectory() as temp_dir:
         storage = FileCheckpointStorage(temp_dir)
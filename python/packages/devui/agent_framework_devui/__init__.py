@@ -2,17 +2,46 @@
 
 """Agent Framework DevUI - Debug interface with OpenAI compatible API server."""
 
+import importlib
 import importlib.metadata
 import logging
 import webbrowser
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ._server import DevServer
-from .models import AgentFrameworkRequest, OpenAIError, OpenAIResponse, ResponseStreamEvent
-from .models._discovery_models import DiscoveryResponse, EntityInfo, EnvVarRequirement
+if TYPE_CHECKING:
+    from ._server import DevServer
+    from .models import AgentFrameworkRequest, OpenAIError, OpenAIResponse, ResponseStreamEvent
+    from .models._discovery_models import DiscoveryResponse, EntityInfo, EnvVarRequirement
 
 logger = logging.getLogger(__name__)
 
+# Re-exports resolved lazily (PEP 562) so importing the package - e.g. for
+# `devui --help` - does not pay the FastAPI/server import cost up front.
+_LAZY_IMPORTS = {
+    "DevServer": "._server",
+    "AgentFrameworkRequest": ".models",
+    "OpenAIError": ".models",
+    "OpenAIResponse": ".models",
+    "ResponseStreamEvent": ".models",
+    "DiscoveryResponse": ".models._discovery_models",
+    "EntityInfo": ".models._discovery_models",
+    "EnvVarRequirement": ".models._discovery_models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so subsequent lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 try:
     __version__ = importlib.metadata.version(__name__)
 except importlib.metadata.PackageNotFoundError:
@@ -45,6 +74,8 @@ def serve(
 
     import uvicorn
 
+    from ._server import DevServer
+
     # Validate host parameter early for security
     if not re.match(r"^(localhost|127\.0\.0\.1|0\.0\.0\.0|[a-zA-Z0-9.-]+)$", host):
         raise ValueError(f"Invalid host: {host}. Must be localhost, IP address, or valid hostname")
@@ -125,8 +156,25 @@ def serve(
 
         threading.Thread(target=open_browser, daemon=True).start()
 
+    # Prefer the C event loop and HTTP parser when available (both ship with
+    # uvicorn[standard]); uvloop is not available on Windows, so fall back to
+    # uvicorn's defaults rather than failing at startup.
+    uvicorn_kwargs: dict[str, Any] = {"host": host, "port": port, "log_level": "info", "access_log": False}
+    try:
+        import uvloop  # noqa: F401
+
+        uvicorn_kwargs["loop"] = "uvloop"
+    except ImportError:
+        pass
+    try:
+        import httptools  # noqa: F401
+
+        uvicorn_kwargs["http"] = "httptools"
+    except ImportError:
+        pass
+
     logger.info(f"Starting Agent Framework DevUI on {host}:{port}")
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    uvicorn.run(app, **uvicorn_kwargs)
 
 
 def main() -> None:
@@ -184,6 +184,10 @@ class InMemoryConversationStore(ConversationStore):
         # Item index for O(1) lookup: {conversation_id: {item_id: ConversationItem}}
         self._item_index: dict[str, dict[str, ConversationItem]] = {}
 
+        # Metadata index for O(1) filtering: {(key, value): {conversation_id: None}}
+        # Inner dicts are used as ordered sets so results keep creation order.
+        self._metadata_index: dict[tuple[str, str], dict[str, None]] = {}
+
     def create_conversation(self, metadata: dict[str, str] | None = None) -> Conversation:
         """Create a new conversation with underlying AgentThread."""
         conv_id = f"conv_{uuid.uuid4().hex}"
@@ -203,6 +207,10 @@ class InMemoryConversationStore(ConversationStore):
         # Initialize item index for this conversation
         self._item_index[conv_id] = {}
 
+        # Index metadata pairs for filtered listing
+        for key, value in (metadata or {}).items():
+            self._metadata_index.setdefault((key, value), {})[conv_id] = None
+
         return Conversation(id=conv_id, object="conversation", created_at=created_at, metadata=metadata)
 
     def get_conversation(self, conversation_id: str) -> Conversation | None:
@@ -224,6 +232,14 @@ class InMemoryConversationStore(ConversationStore):
         if not conv_data:
             raise ValueError(f"Conversation {conversation_id} not found")
 
+        # Re-index only the pairs that actually changed so conversations keep
+        # their position in untouched index entries.
+        old_metadata: dict[str, str] = conv_data.get("metadata", {})
+        for pair in set(old_metadata.items()) - set(metadata.items()):
+            self._remove_metadata_pair(pair, conversation_id)
+        for pair in set(metadata.items()) - set(old_metadata.items()):
+            self._metadata_index.setdefault(pair, {})[conversation_id] = None
+
         conv_data["metadata"] = metadata
 
         return Conversation(
@@ -238,9 +254,12 @@ class InMemoryConversationStore(ConversationStore):
         if conversation_id not in self._conversations:
             raise ValueError(f"Conversation {conversation_id} not found")
 
+        conv_metadata: dict[str, str] = self._conversations[conversation_id].get("metadata", {})
         del self._conversations[conversation_id]
-        # Cleanup item index
+        # Cleanup item and metadata indexes
         self._item_index.pop(conversation_id, None)
+        for pair in conv_metadata.items():
+            self._remove_metadata_pair(pair, conversation_id)
 
         return ConversationDeletedResource(id=conversation_id, object="conversation.deleted", deleted=True)
 
@@ -322,6 +341,11 @@ class InMemoryConversationStore(ConversationStore):
 
         thread: AgentThread = conv_data["thread"]
 
+        # For the default ascending, no-cursor case we can stop converting as
+        # soon as the page is full (plus one item to compute has_more) instead
+        # of materializing every message in the thread first.
+        early_exit = order == "asc" and after is None
+
         # Get messages from thread's message store
         items: list[ConversationItem] = []
         if thread.message_store:
@@ -329,6 +353,8 @@ class InMemoryConversationStore(ConversationStore):
 
             # Convert each AgentFramework ChatMessage to appropriate ConversationItem type(s)
             for i, msg in enumerate(af_messages):
+                if early_exit and len(items) > limit:
+                    break
                 item_id = f"item_{i}"
                 role_str = msg.role.value if hasattr(msg.role, "value") else str(msg.role)
                 role = cast(MessageRole, role_str)  # Safe: Agent Framework roles match OpenAI roles
@@ -455,19 +481,36 @@ class InMemoryConversationStore(ConversationStore):
         conv_data = self._conversations.get(conversation_id)
         return conv_data["thread"] if conv_data else None
 
+    def _remove_metadata_pair(self, pair: tuple[str, str], conversation_id: str) -> None:
+        """Drop a conversation from one metadata index entry, pruning empty entries."""
+        entry = self._metadata_index.get(pair)
+        if entry is not None:
+            entry.pop(conversation_id, None)
+            if not entry:
+                del self._metadata_index[pair]
+
     def list_conversations_by_metadata(self, metadata_filter: dict[str, str]) -> list[Conversation]:
         """Filter conversations by metadata (e.g., agent_id)."""
+        # Intersect the index entries for each filter pair instead of scanning
+        # every conversation. An empty filter matches all conversations.
+        if metadata_filter:
+            entries = [self._metadata_index.get(pair) for pair in metadata_filter.items()]
+            if any(entry is None for entry in entries):
+                return []
+            smallest, *rest = sorted(entries, key=len)  # type: ignore[arg-type]
+            matching_ids = [conv_id for conv_id in smallest if all(conv_id in entry for entry in rest)]  # type: ignore[union-attr]
+        else:
+            matching_ids = list(self._conversations.keys())
+
         results = []
-        for conv_data in self._conversations.values():
-            conv_meta = conv_data.get("metadata", {})
-            # Check if all filter items match
-            if all(conv_meta.get(k) == v for k, v in metadata_filter.items()):
-                results.append(
-                    Conversation(
-                        id=conv_data["id"],
-                        object="conversation",
-                        created_at=conv_data["created_at"],
-                        metadata=conv_meta,
-                    )
+        for conv_id in matching_ids:
+            conv_data = self._conversations[conv_id]
+            results.append(
+                Conversation(
+                    id=conv_data["id"],
+                    object="conversation",
+                    created_at=conv_data["created_at"],
+                    metadata=conv_data.get("metadata", {}),
                 )
+            )
         return results
@@ -7,6 +7,7 @@ from __future__ import annotations
 import importlib
 import importlib.util
 import logging
+import os
 import sys
 import uuid
 from pathlib import Path
@@ -350,34 +351,50 @@ class EntityDiscovery:
         if entities_dir_str not in sys.path:
             sys.path.insert(0, entities_dir_str)
 
-        # Scan for directories and Python files WITHOUT importing
-        for item in entities_dir.iterdir():  # noqa: ASYNC240
-            if item.name.startswith(".") or item.name == "__pycache__":
-                continue
+        # Scan for directories and Python files WITHOUT importing.
+        # os.scandir reuses the stat information from the directory listing,
+        # so each candidate costs one syscall instead of one per exists() check.
+        with os.scandir(entities_dir) as dir_iter:
+            for entry in dir_iter:
+                if entry.name.startswith(".") or entry.name == "__pycache__":
+                    continue
+
+                if entry.is_dir():
+                    child_names = self._list_child_names(entry.path)
+                    if self._looks_like_entity(child_names):
+                        # Directory-based entity - create sparse metadata
+                        self._register_sparse_entity(Path(entry.path), child_names)
+                elif entry.is_file() and entry.name.endswith(".py") and not entry.name.startswith("_"):
+                    # Single file entity - create sparse metadata
+                    self._register_sparse_file_entity(Path(entry.path))
+
+    def _list_child_names(self, dir_path: str) -> set[str]:
+        """List the file names directly inside a directory.
 
-            if item.is_dir() and self._looks_like_entity(item):
-                # Directory-based entity - create sparse metadata
-                self._register_sparse_entity(item)
-            elif item.is_file() and item.suffix == ".py" and not item.name.startswith("_"):
-                # Single file entity - create sparse metadata
-                self._register_sparse_file_entity(item)
+        Args:
+            dir_path: Directory to list
 
-    def _looks_like_entity(self, dir_path: Path) -> bool:
+        Returns:
+            Set of child entry names (empty if the directory is unreadable)
+        """
+        try:
+            with os.scandir(dir_path) as child_iter:
+                return {entry.name for entry in child_iter}
+        except OSError:
+            return set()
+
+    def _looks_like_entity(self, child_names: set[str]) -> bool:
         """Check if directory contains an entity (without importing).
 
         Args:
-            dir_path: Directory to check
+            child_names: Names of the directory's children
 
         Returns:
             True if directory appears to contain an entity
         """
-        return (
-            (dir_path / "agent.py").exists()
-            or (dir_path / "workflow.py").exists()
-            or (dir_path / "__init__.py").exists()
-        )
+        return "agent.py" in child_names or "workflow.py" in child_names or "__init__.py" in child_names
 
-    def _detect_entity_type(self, dir_path: Path) -> str:
+    def _detect_entity_type(self, child_names: set[str]) -> str:
         """Detect entity type from directory structure (without importing).
 
         Uses filename conventions to determine entity type:
@@ -386,13 +403,13 @@ class EntityDiscovery:
         - both or neither → "unknown"
 
         Args:
-            dir_path: Directory to analyze
+            child_names: Names of the directory's children
 
         Returns:
             Entity type: "workflow", "agent", or "unknown"
         """
-        has_agent = (dir_path / "agent.py").exists()
-        has_workflow = (dir_path / "workflow.py").exists()
+        has_agent = "agent.py" in child_names
+        has_workflow = "workflow.py" in child_names
 
         if has_agent and has_workflow:
             # Both files exist - ambiguous, mark as unknown
@@ -404,14 +421,15 @@ class EntityDiscovery:
         # Has __init__.py but no specific file
         return "unknown"
 
-    def _register_sparse_entity(self, dir_path: Path) -> None:
+    def _register_sparse_entity(self, dir_path: Path, child_names: set[str]) -> None:
         """Register entity with sparse metadata (no import).
 
         Args:
             dir_path: Entity directory
+            child_names: Names of the directory's children
         """
         entity_id = dir_path.name
-        entity_type = self._detect_entity_type(dir_path)
+        entity_type = self._detect_entity_type(child_names)
 
         entity_info = EntityInfo(
             id=entity_id,
@@ -4,6 +4,7 @@
 
 import json
 import logging
+import time
 import uuid
 from collections import OrderedDict
 from collections.abc import Sequence
@@ -201,7 +202,7 @@ class MessageMapper:
             return OpenAIResponse(
                 id=f"resp_{uuid.uuid4().hex[:12]}",
                 object="response",
-                created_at=datetime.now().timestamp(),
+                created_at=time.time(),
                 model=request.model,
                 output=[response_output_message],
                 usage=usage,
@@ -751,7 +752,7 @@ class MessageMapper:
         return OpenAIResponse(
             id=f"resp_{uuid.uuid4().hex[:12]}",
             object="response",
-            created_at=datetime.now().timestamp(),
+            created_at=time.time(),
             model=request.model,
             output=[response_output_message],
             usage=usage,
@@ -14,6 +14,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
+try:
+    # Serialize responses with orjson when it is installed - measurably faster
+    # than the stdlib encoder for the dict payloads these endpoints return.
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+
+    _default_response_class: type[JSONResponse] = ORJSONResponse
+except ImportError:  # pragma: no cover - stdlib JSONResponse works everywhere
+    _default_response_class = JSONResponse
+
 from ._discovery import EntityDiscovery
 from ._executor import AgentFrameworkExecutor
 from ._mapper import MessageMapper
@@ -132,6 +142,7 @@ class DevServer:
             description="OpenAI-compatible API server for Agent Framework and other AI frameworks",
             version="1.0.0",
             lifespan=lifespan,
+            default_response_class=_default_response_class,
         )
 
         # Add CORS middleware
@@ -315,13 +326,16 @@ class DevServer:
         async def create_response(request: AgentFrameworkRequest, raw_request: Request) -> Any:
             """OpenAI Responses API endpoint."""
             try:
-                raw_body = await raw_request.body()
-                logger.info(f"Raw request body: {raw_body.decode()}")
-                logger.info(f"Parsed request: model={request.model}, extra_body={request.extra_body}")
+                # Only pay for body re-reads and f-string formatting when debug
+                # logging is actually on; this runs on every request.
+                if logger.isEnabledFor(logging.DEBUG):
+                    raw_body = await raw_request.body()
+                    logger.debug(f"Raw request body: {raw_body.decode()}")
+                    logger.debug(f"Parsed request: model={request.model}, extra_body={request.extra_body}")
 
                 # Get entity_id using the new method
                 entity_id = request.get_entity_id()
-                logger.info(f"Extracted entity_id: {entity_id}")
+                logger.debug(f"Extracted entity_id: {entity_id}")
 
                 if not entity_id:
                     error = OpenAIError.create(f"Missing entity_id. Request extra_body: {request.extra_body}")
@@ -331,7 +345,7 @@ class DevServer:
                 executor = await self._ensure_executor()
                 try:
                     entity_info = executor.get_entity_info(entity_id)
-                    logger.info(f"Found entity: {entity_info.name} ({entity_info.type})")
+                    logger.debug(f"Found entity: {entity_info.name} ({entity_info.type})")
                 except Exception:
                     error = OpenAIError.create(f"Entity not found: {entity_id}")
                     return JSONResponse(status_code=404, content=error.to_dict())
@@ -502,12 +516,17 @@ class DevServer:
     ) -> AsyncGenerator[str, None]:
         """Stream execution directly through executor."""
         try:
-            # Collect events for final response.completed event
-            events = []
+            # Retain only the text-delta events that final aggregation reads;
+            # keeping every event alive for the whole stream pins large
+            # workflow and trace payloads in memory until the response ends.
+            delta_events = []
+            event_count = 0
 
             # Stream all events
             async for event in executor.execute_streaming(request):
-                events.append(event)
+                event_count += 1
+                if getattr(event, "type", None) == "response.output_text.delta":
+                    delta_events.append(event)
 
                 # IMPORTANT: Check model_dump_json FIRST because to_json() can have newlines (pretty-printing)
                 # which breaks SSE format. model_dump_json() returns single-line JSON.
@@ -529,11 +548,11 @@ class DevServer:
             # Aggregate to final response and emit response.completed event (OpenAI standard)
             from .models import ResponseCompletedEvent
 
-            final_response = await executor.message_mapper.aggregate_to_response(events, request)
+            final_response = await executor.message_mapper.aggregate_to_response(delta_events, request)
             completed_event = ResponseCompletedEvent(
                 type="response.completed",
                 response=final_response,
-                sequence_number=len(events),
+                sequence_number=event_count,
             )
             yield f"data: {completed_event.model_dump_json()}\n\n"
 
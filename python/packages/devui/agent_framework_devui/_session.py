@@ -3,6 +3,7 @@
 """Session management for agent execution tracking."""
 
 import logging
+import time
 import uuid
 from datetime import datetime
 from typing import Any
@@ -176,7 +177,7 @@ class SessionManager:
         Args:
             max_age_hours: Maximum age of sessions to keep in hours
         """
-        cutoff_time = datetime.now().timestamp() - (max_age_hours * 3600)
+        cutoff_time = time.time() - (max_age_hours * 3600)
 
         sessions_to_remove = []
         for session_id, session in self.sessions.items():
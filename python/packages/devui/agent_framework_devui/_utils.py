@@ -2,6 +2,8 @@
 
 """Utility functions for DevUI."""
 
+import copy
+import functools
 import inspect
 import json
 import logging
@@ -312,12 +314,33 @@ def generate_input_schema(input_type: type) -> dict[str, Any]:
     4. Dataclasses (via fields introspection)
     5. Fallback to string
 
+    Schemas are pure functions of the type, so generation is cached; the
+    introspection (signature parsing, get_type_hints) otherwise re-runs on
+    every entity-info request.
+
     Args:
         input_type: Input type to generate schema for
 
     Returns:
         JSON schema dict
     """
+    try:
+        schema = _generate_input_schema_cached(input_type)
+    except TypeError:
+        # Unhashable type annotation - generate without caching
+        return _generate_input_schema(input_type)
+    # Copy so callers can safely mutate the result without poisoning the cache
+    return copy.deepcopy(schema)
+
+
+@functools.lru_cache(maxsize=128)
+def _generate_input_schema_cached(input_type: type) -> dict[str, Any]:
+    """Cached schema generation keyed by the (hashable) input type."""
+    return _generate_input_schema(input_type)
+
+
+def _generate_input_schema(input_type: type) -> dict[str, Any]:
+    """Generate the schema for an input type (uncached)."""
     # 1. Built-in types
     if input_type is str:
         return {"type": "string"}
@@ -131,6 +131,31 @@ async def test_list_conversations_by_metadata():
     assert results[0].id == conv3.id
 
 
+@pytest.mark.asyncio
+async def test_list_conversations_by_metadata_after_update_and_delete():
+    """Test that metadata filtering stays correct across updates and deletes."""
+    store = InMemoryConversationStore()
+
+    conv1 = store.create_conversation(metadata={"agent_id": "agent1"})
+    conv2 = store.create_conversation(metadata={"agent_id": "agent1"})
+
+    # Moving a conversation to another agent removes it from the old filter
+    store.update_conversation(conv2.id, metadata={"agent_id": "agent2"})
+
+    results = store.list_conversations_by_metadata({"agent_id": "agent1"})
+    assert [c.id for c in results] == [conv1.id]
+
+    results = store.list_conversations_by_metadata({"agent_id": "agent2"})
+    assert [c.id for c in results] == [conv2.id]
+
+    # Deleting a conversation removes it from its filter
+    store.delete_conversation(conv1.id)
+    assert store.list_conversations_by_metadata({"agent_id": "agent1"}) == []
+
+    # Unknown metadata matches nothing
+    assert store.list_conversations_by_metadata({"agent_id": "missing"}) == []
+
+
 @pytest.mark.asyncio
 async def test_add_items():
     """Test adding items to conversation."""